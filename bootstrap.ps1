@@ -274,7 +274,8 @@ Function Install-Scoop {
 
 Function Install-Python-Dependency {
     # Prepare virtual Python environment
-    if ((Test-Path -Path 'requirements.txt') -or (Test-Path -Path 'Pipfile')) {
+    $hasRequirements = Test-Path -Path 'requirements.txt'
+    if ($hasRequirements -or (Test-Path -Path 'Pipfile')) {
         Invoke-CommandLine "python -m pip install pipenv pip-system-certs"
         if ($clean) {
             # Start with a fresh virtual environment
@@ -285,7 +286,7 @@ Function Install-Python-Dependency {
         if (-Not (Test-Path -Path '.venv')) {
             New-Item -ItemType Directory '.venv'
         }
-        if (Test-Path -Path 'requirements.txt') {
+        if ($hasRequirements) {
             Write-Output "File 'requirements.txt' found, running 'python -m pipenv' to create a virtual environment ..."
             Invoke-CommandLine "python -m pipenv install --requirements requirements.txt"
         }
@@ -1,5 +1,10 @@
 #Requires -Version 5.1
 
+param(
+    [Parameter(Mandatory = $false, HelpMessage = 'Tags of tests to be skipped, e.g. Integration (String[])')]
+    [String[]]$ExcludeTag = @()
+)
+
 $testsFolder = Join-Path $PSScriptRoot ".."
 
 $testConfig = New-PesterConfiguration -Hashtable @{
@@ -7,6 +12,9 @@ $testConfig = New-PesterConfiguration -Hashtable @{
         Path     = $testsFolder
         PassThru = $true
     }
+    Filter = @{
+        ExcludeTag = $ExcludeTag
+    }
     Output = @{
         Verbosity = 'Detailed'
     }
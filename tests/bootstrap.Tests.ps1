@@ -51,7 +51,7 @@ Describe "Create a file with confirmation" {
 }
 
 Describe "invoking command line calls" {
-    BeforeEach {
+    BeforeAll {
         Mock -CommandName Write-Output -MockWith {}
         Mock -CommandName Write-Error -MockWith {}
     }
@@ -99,7 +99,7 @@ Describe "invoking command line calls" {
 }
 
 Describe "install scoop" {
-    BeforeEach {
+    BeforeAll {
         Mock -CommandName Invoke-Expression -MockWith {}
         Mock -CommandName Invoke-CommandLine -MockWith {}
         Mock -CommandName Initialize-EnvPath -MockWith {}
@@ -125,7 +125,7 @@ Describe "install scoop" {
 }
 
 Describe "install python deps" {
-    BeforeEach {
+    BeforeAll {
         Mock -CommandName Invoke-CommandLine -MockWith {}
     }
 
@@ -169,7 +169,7 @@ Describe "install python deps" {
 }
 
 Describe "install west" {
-    BeforeEach {
+    BeforeAll {
         Mock -CommandName Invoke-CommandLine -MockWith {}
         Mock -CommandName New-Item -MockWith {}
     }
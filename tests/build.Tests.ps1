@@ -19,7 +19,7 @@ BeforeAll {
 }
 
 Describe "Full integration tests for project creation" {
-    It "Shall create project directory structure with executable build script" {
+    It "Shall create project directory structure with executable build script" -Tag 'Integration' {
         Test-Path (Join-Path $testDataWithoutProxy 'build.bat') | Should -Be $true
         Test-Path (Join-Path $testDataWithoutProxy 'build.ps1') | Should -Be $true
         Test-Path (Join-Path $testDataWithoutProxy '.env') | Should -Be $false
@@ -97,7 +97,7 @@ Describe "initialize proxy settings" {
 }
 
 Describe "invoking command line calls" {
-    BeforeEach {
+    BeforeAll {
         Mock -CommandName Write-Output -MockWith {}
         Mock -CommandName Write-Error -MockWith {}
     }